@@ -10,79 +10,314 @@ Features:
 
 import os
 import logging
-from flask import Flask, url_for, render_template
-from config import PHOTOS_DIR, LOG_FILE, STATIC_DIR
+import tempfile
+from email.utils import formatdate
+from functools import lru_cache
+from flask import Flask, render_template, url_for
+from jinja2 import FileSystemBytecodeCache
+from config import PHOTOS_DIR, LOG_FILE
 
 # ------------------ Configuration ------------------ #
 MAX_RECENT_PHOTOS: int = 10
+TAIL_READ_BYTES: int = 8192  # Log tail window; covers far more than MAX_RECENT_PHOTOS entries
 
 # ------------------ Logging ------------------ #
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 
+# ------------------ Static Photo Serving ------------------ #
+class PhotoStaticMiddleware:
+    """
+    WSGI middleware serving photo JPEGs directly from the images directory.
+
+    Flask's default static handler copies every byte through Python buffers.
+    This middleware hands the open file to the server's wsgi.file_wrapper,
+    which lets it use the sendfile(2) zero-copy path, and falls back to a
+    chunked reader otherwise. Responses carry ETag and Last-Modified headers
+    so browsers can revalidate instead of re-downloading.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    # Filenames are timestamped and never rewritten, so cached copies never go stale
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    def __init__(self, wsgi_app, directory, url_prefix):
+        self.wsgi_app = wsgi_app
+        self.directory = directory
+        self.url_prefix = url_prefix
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO", "")
+        if not (path.startswith(self.url_prefix) and path.endswith(".jpg")):
+            return self.wsgi_app(environ, start_response)
+
+        filename = path[len(self.url_prefix):]
+        if filename != os.path.basename(filename):  # Reject nested or ../ paths
+            return self.wsgi_app(environ, start_response)
+
+        try:
+            f = open(os.path.join(self.directory, filename), "rb")
+        except OSError:
+            return self.wsgi_app(environ, start_response)
+
+        st = os.fstat(f.fileno())
+        etag = f'"{st.st_ino:x}-{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+        # Short-circuit revalidation: matching ETag means zero bytes on the wire
+        if environ.get("HTTP_IF_NONE_MATCH") == etag:
+            f.close()
+            start_response("304 Not Modified", [
+                ("ETag", etag),
+                ("Cache-Control", self.CACHE_CONTROL),
+            ])
+            return []
+
+        headers = [
+            ("Content-Type", "image/jpeg"),
+            ("Content-Length", str(st.st_size)),
+            ("ETag", etag),
+            ("Last-Modified", formatdate(st.st_mtime, usegmt=True)),
+            ("Cache-Control", self.CACHE_CONTROL),
+        ]
+        start_response("200 OK", headers)
+
+        file_wrapper = environ.get("wsgi.file_wrapper")
+        if file_wrapper is not None:
+            return file_wrapper(f, self.CHUNK_SIZE)
+        return self._chunked_body(f)
+
+    def _chunked_body(self, f):
+        """
+        Yield the file in chunks, closing it when the response finishes.
+        """
+        try:
+            while True:
+                chunk = f.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            f.close()
+
+
 # ------------------ Flask App ------------------ #
 app = Flask(__name__)
 
+# Resolve the static images prefix through Flask's URL map exactly once;
+# routing never changes after startup, so photo URLs are plain string concat.
+with app.test_request_context():
+    IMAGES_URL_PREFIX: str = url_for("static", filename="images/").rstrip("/") + "/"
+
+app.wsgi_app = PhotoStaticMiddleware(app.wsgi_app, PHOTOS_DIR, IMAGES_URL_PREFIX)
+
+# Cache compiled templates aggressively: keep them in memory across requests
+# and persist the compiled bytecode on disk so restarts skip re-compilation.
+_JINJA_CACHE_DIR = os.path.join(tempfile.gettempdir(), "pi_email_photo_jinja")
+os.makedirs(_JINJA_CACHE_DIR, exist_ok=True)
+app.jinja_env.cache_size = 200
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(_JINJA_CACHE_DIR)
+
+
+def warm_template_cache() -> None:
+    """
+    Compile the templates once at startup so the first request
+    pays no Jinja parse/compile cost.
+    """
+    for name in ("index.html", "check_photos.html"):
+        try:
+            app.jinja_env.get_template(name)
+        except Exception as e:
+            logging.warning(f"Could not pre-compile template {name}: {e}")
+
+
+warm_template_cache()
+
 # ------------------ Helpers ------------------ #
+# Cache for get_photo_count, invalidated whenever the log file changes on disk.
+_count_cache: dict = {"mtime_ns": None, "size": None, "count": 0}
+
+
 def get_photo_count() -> int:
     """
     Return the number of photos logged in the log file.
 
+    The count is cached between requests and only recomputed when the
+    log file's mtime or size changes, so repeated requests avoid
+    re-reading the whole file.
+
     Returns:
         int: Number of valid photo entries.
     """
-    if not os.path.exists(LOG_FILE):
+    try:
+        st = os.stat(LOG_FILE)
+    except FileNotFoundError:
         return 0
 
+    if (st.st_mtime_ns, st.st_size) == (_count_cache["mtime_ns"], _count_cache["size"]):
+        return _count_cache["count"]
+
     with open(LOG_FILE, "r") as f:
-        lines = [line.strip() for line in f if line.strip()]
-    return len(lines)
+        count = sum(1 for line in f if line.strip())
+
+    _count_cache.update(mtime_ns=st.st_mtime_ns, size=st.st_size, count=count)
+    return count
+
+
+def read_recent_filenames() -> list:
+    """
+    Return up to the MAX_RECENT_PHOTOS most recent filenames from the log file.
+
+    Only the last TAIL_READ_BYTES of the file are read, so the cost per
+    request stays constant no matter how large the log grows.
+
+    Returns:
+        list: Most recent photo filenames, oldest first.
+    """
+    with open(LOG_FILE, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - TAIL_READ_BYTES))
+        lines = f.read().splitlines()
+
+    if size > TAIL_READ_BYTES:
+        lines = lines[1:]  # Drop the first line, which may be truncated mid-entry
+
+    filenames = [line.decode().strip() for line in lines if line.strip()]
+    return filenames[-MAX_RECENT_PHOTOS:]
+
+
+# Tracks the photos directory mtime and its contents so cached URLs and the
+# existing-file set are dropped when the directory changes.
+_photos_dir_state: dict = {"mtime_ns": None, "names": frozenset()}
+
+
+def existing_photos() -> frozenset:
+    """
+    Return the set of filenames currently present in the photos directory.
+
+    The directory is listed with a single os.scandir pass and the result
+    cached until the directory mtime changes, so membership checks cost
+    no syscalls at all on repeated requests.
+
+    Returns:
+        frozenset: Filenames present in PHOTOS_DIR (empty if missing).
+    """
+    try:
+        mtime_ns = os.stat(PHOTOS_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return frozenset()
+
+    if mtime_ns != _photos_dir_state["mtime_ns"]:
+        with os.scandir(PHOTOS_DIR) as entries:
+            _photos_dir_state["names"] = frozenset(e.name for e in entries)
+        _photos_dir_state["mtime_ns"] = mtime_ns
+        _photo_url_cached.cache_clear()
+
+    return _photos_dir_state["names"]
+
+
+@lru_cache(maxsize=256)
+def _photo_url_cached(filename: str):
+    """
+    Return the URL for a photo filename, or None if the file is missing.
+    """
+    if filename not in _photos_dir_state["names"]:
+        return None
+    return IMAGES_URL_PREFIX + filename
+
+
+def thumbnail_name(filename: str) -> str:
+    """
+    Return the thumbnail filename for a photo (photo_x.jpg -> photo_x_thumb.jpg).
+    """
+    root, ext = os.path.splitext(filename)
+    return f"{root}_thumb{ext}"
+
+
+def photo_url(filename: str):
+    """
+    Return the cached URL for a photo filename, or None if the file is missing.
+
+    Results are cached per filename; the cache is cleared whenever the
+    photos directory changes, so newly added or removed files are picked up.
+
+    Args:
+        filename: Photo filename as recorded in the log file.
+    Returns:
+        URL string under the static images route, or None.
+    """
+    if not existing_photos():
+        return None
+    return _photo_url_cached(filename)
 
 
 # ------------------ Routes ------------------ #
+# Rendered homepage HTML keyed by photo count. The count only changes on a
+# new capture, so almost every request is served without a Jinja render.
+_INDEX_CACHE_MAX = 16
+_index_cache: dict = {}
+
+
 @app.route("/")
 def index():
     """
     Render the homepage with a button linking to /check-photos
-    and display the total number of photos recorded.
+    and display the total number of photos recorded. Pages are cached
+    per photo count since that is the only variable on the page.
     """
     photo_count = get_photo_count()
-    return render_template("index.html", photo_count=photo_count)
+    html = _index_cache.get(photo_count)
+    if html is None:
+        html = render_template("index.html", photo_count=photo_count)
+        if len(_index_cache) >= _INDEX_CACHE_MAX:
+            # The count is monotonic, so the oldest insertion is the stalest
+            _index_cache.pop(next(iter(_index_cache)))
+        _index_cache[photo_count] = html
+    return html
+
+
+# Rendered /check-photos HTML, keyed on the log-file and photos-dir state
+# that produced it. The gallery only changes when a photo is captured (at
+# most once per cooldown), so nearly every request is a cache hit.
+_gallery_cache: dict = {"key": None, "html": None}
 
 
 @app.route("/check-photos")
 def check_photos():
     """
     Display the most recent photos logged in photo_logs.txt, with error handling.
+    The rendered page is cached and reused until the log file or photos
+    directory changes on disk.
     """
-    if not os.path.exists(LOG_FILE):
+    try:
+        log_stat = os.stat(LOG_FILE)
+    except FileNotFoundError:
         return render_template("check_photos.html", photos=None, message="No photos found.")
 
-    # Read filenames from the log file
-    with open(LOG_FILE, "r") as f:
-        filenames = [line.strip() for line in f if line.strip()]
+    existing_photos()  # Refresh the photos-dir stat guard before building the key
+    cache_key = (log_stat.st_mtime_ns, log_stat.st_size, _photos_dir_state["mtime_ns"])
+    if cache_key == _gallery_cache["key"]:
+        return _gallery_cache["html"]
 
-    # Show only the most recent photos
-    recent_photos = filenames[-MAX_RECENT_PHOTOS:]
+    # Read only the tail of the log file for the most recent photos
+    recent_photos = read_recent_filenames()
 
+    # Build URLs from the cache, skipping files that are missing on disk.
+    # The gallery embeds the small thumbnail and links to the full photo;
+    # older photos without a thumbnail fall back to the full-size image.
     photos = []
     for filename in recent_photos:
-        try:
-            photo_path = os.path.join(PHOTOS_DIR, filename)
-            if not os.path.exists(photo_path):
-                continue  # Skip if the file is missing
-
-            # Compute path relative to static folder
-            relative_path = os.path.relpath(photo_path, STATIC_DIR)
-            photo_url = url_for("static", filename=relative_path)
-            photos.append(photo_url)
-
-        except Exception as e:
-            logging.error(f"Could not display {filename}: {e}", exc_info=True)
+        full = photo_url(filename)
+        if not full:
+            continue
+        thumb = photo_url(thumbnail_name(filename)) or full
+        photos.append({"full": full, "thumb": thumb})
 
-    if not photos:
-        return render_template("check_photos.html", photos=None, message="No photos available.")
+    if photos:
+        html = render_template("check_photos.html", photos=photos, message=None)
+    else:
+        html = render_template("check_photos.html", photos=None, message="No photos available.")
 
-    return render_template("check_photos.html", photos=photos, message=None)
+    _gallery_cache.update(key=cache_key, html=html)
+    return html
 
 
 # ------------------ Main Entry ------------------ #
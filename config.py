@@ -14,16 +14,25 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 STATIC_DIR = os.path.join(BASE_DIR, "static")
 PHOTOS_DIR = os.path.join(STATIC_DIR, "images")
 FRAME_SIZE = (640, 480)
+PHOTO_JPEG_QUALITY = 85
+THUMBNAIL_SIZE = (320, 240)
+THUMBNAIL_JPEG_QUALITY = 70
 WINDOW_NAME = "Camera"
 LOGS_DIR = os.path.join(BASE_DIR, "logs")
 LOG_FILE = os.path.join(LOGS_DIR, "photo_logs.txt")
 
 # --- Email Settings ---
+# Validated lazily via require_email_credentials() so components that never
+# send email (e.g. the Flask web app) can start without credentials.
 SENDER_EMAIL = os.getenv("MY_EMAIL")
 PASSWORD = os.getenv("MY_EMAIL_APP_PASSWORD")
-if not SENDER_EMAIL or not PASSWORD:
-    raise ValueError("Please set MY_EMAIL and MY_EMAIL_APP_PASSWORD in .env")
 RECEIVER_EMAIL = SENDER_EMAIL
+
+def require_email_credentials():
+    """Raise ValueError unless the email env vars are set. Call before sending."""
+    if not SENDER_EMAIL or not PASSWORD:
+        raise ValueError("Please set MY_EMAIL and MY_EMAIL_APP_PASSWORD in .env")
+
 SUBJECT = "Photo from Raspberry Pi"
 BODY = "Sent from Raspberry Pi"
 
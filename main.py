@@ -31,39 +31,43 @@ Threading Overview:
    - Sets up PIR sensor callbacks.
    - Remains mostly idle using `signal.pause()` to keep the program running.
 
-2. Camera Preview Thread (1 thread):
+2. Camera Threads (2 threads):
    - Started by `start_preview()`.
-   - Continuously captures frames from the PiCamera2 and displays them in a preview window using OpenCV.
-   - Runs until the preview_stop_event is set.
-
-3. Yellow LED Blinking Thread(s) (1 per blink session, potentially multiple over time):
-   - Started by `start_yellow_blink()` or `start_flash_yellow()`.
-   - Toggles the YELLOW LED on/off at specified intervals.
-   - Daemon threads that stop automatically when the corresponding flag (`yellow_blinking` or `yellow_flash`) is set to False.
-
-4. Green LED Flash Thread (1 per flash event):
-   - Started by `flash_green()`.
-   - Blinks the GREEN LED a fixed number of times to indicate successful email sent.
+   - A capture thread continuously reads frames from the PiCamera2 into a single
+     latest-frame slot; a display thread shows the newest frame in a preview
+     window using OpenCV. A slow display drops frames instead of stalling capture.
+   - Both run until the preview_stop_event is set.
+
+3. Yellow LED Worker Threads (2 persistent threads):
+   - Launched once by `start_led_workers()`.
+   - One blinks the YELLOW LED every second while armed, the other flashes it
+     rapidly; `start_/stop_` helpers arm and disarm them via Events.
+   - Daemon threads that idle on their Event when disarmed.
+
+4. Green LED Worker Thread (1 persistent thread):
+   - Launched once by `start_led_workers()`.
+   - Blinks the GREEN LED a fixed number of times per request on a Semaphore
+     to indicate successful email sent.
    - Daemon thread.
 
 5. Motion Handler Thread (1 thread):
    - Started in `main()` via `threading.Thread(target=handle_motion, daemon=True)`.
-   - Continuously monitors the duration of detected motion.
+   - Blocks on motion/cooldown events and wakes only when motion is detected.
    - Captures photos and sends email if motion exceeds threshold and cooldown is inactive.
 
-6. Cooldown Timer Thread (1 per cooldown event):
-   - Started within `handle_motion()` after a photo/email event.
+6. Cooldown Timer (1 per cooldown event):
+   - A `threading.Timer` started by `start_cooldown()` after a photo/email event.
    - Sets `cooldown_active` flag for `COOLDOWN_DURATION_SECONDS` to prevent repeated triggers.
 
 Summary:
 - Main thread: 1
-- Active threads at any given time: 
-    - 1 Camera preview thread
+- Active threads at any given time:
+    - 1 Camera capture thread + 1 preview display thread
     - 1 Motion handler thread
-    - 0-1 Yellow LED blinking or flashing thread
-    - 0-1 Green LED flashing thread (only when email sent)
-    - 0-1 Cooldown timer thread (only during cooldown)
-- Total threads created during runtime: multiple daemon threads for LED blinking/flashing and cooldown, plus the main preview and motion threads.
+    - 3 persistent LED worker threads (idle on Events when disarmed)
+    - 0-1 Cooldown timer (only during cooldown)
+- Total threads created during runtime: a fixed set of persistent daemon workers
+  plus a short-lived Timer per cooldown.
 """
 
 
@@ -73,15 +77,20 @@ import signal
 import threading
 import time
 import atexit
+import io
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 from picamera2 import Picamera2
 import yagmail
+from datetime import datetime
 from pathlib import Path
 from config import (
     PIR_PIN, LED_PINS, PHOTOS_DIR, FRAME_SIZE, WINDOW_NAME, LOGS_DIR, LOG_FILE,
+    PHOTO_JPEG_QUALITY, THUMBNAIL_SIZE, THUMBNAIL_JPEG_QUALITY,
     SENDER_EMAIL, PASSWORD, RECEIVER_EMAIL, SUBJECT, BODY,
+    require_email_credentials,
     MOTION_THRESHOLD_SECONDS, COOLDOWN_DURATION_SECONDS,
     YELLOW_FLASH_INTERVAL_SECONDS, GREEN_FLASH_COUNT,
     GREEN_FLASH_INTERVAL_SECONDS,
@@ -98,8 +107,6 @@ logging.basicConfig(
 pir = MotionSensor(PIR_PIN)
 leds = {name: LED(pin) for name, pin in LED_PINS.items()}
 
-yellow_blinking = False
-yellow_flash = False
 cooldown_active = False
 motion_start_time = None  # Timestamp when motion started
 
@@ -108,18 +115,31 @@ picam2 = None
 # Threading synchronization
 lock = threading.Lock()
 preview_stop_event = threading.Event()
+motion_event = threading.Event()  # Set while the PIR sensor reports motion
+cooldown_done_event = threading.Event()  # Cleared during cooldown
+cooldown_done_event.set()
 
 # ------------------ Utility Functions ------------------ #
+# Directories already confirmed to exist, so repeat calls skip the syscall.
+_existing_dirs: set = set()
+
 def ensure_directory(path: str) -> None:
     """
     Ensure the directory exists; create it if it doesn't.
+    Known-existing directories are cached so repeat calls cost nothing.
 
     Args:
         path: Directory path to ensure exists.
     """
-    if not os.path.exists(path):
-        os.makedirs(path)
-        logging.info(f"Created directory: {path}")
+    if path in _existing_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _existing_dirs.add(path)
+    logging.info(f"Directory ready: {path}")
+
+# Create the working directories up front so the per-photo path is zero-syscall
+ensure_directory(PHOTOS_DIR)
+ensure_directory(LOGS_DIR)
 
 def timestamped_filename(prefix: str, ext: str) -> str:
     """
@@ -131,43 +151,154 @@ def timestamped_filename(prefix: str, ext: str) -> str:
     Returns:
         Filename string with timestamp.
     """
-    now = time.localtime()
-    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S", now)
-    return f"{prefix}_{timestamp}.{ext}"
+    return f"{prefix}_{datetime.now():%Y-%m-%d_%H-%M-%S}.{ext}"
+
+def thumbnail_path(photo_path: str) -> str:
+    """
+    Return the thumbnail path for a photo (photo_x.jpg -> photo_x_thumb.jpg).
+
+    Args:
+        photo_path: Path to the full-size photo.
+    Returns:
+        Path for the matching thumbnail file.
+    """
+    root, ext = os.path.splitext(photo_path)
+    return f"{root}_thumb{ext}"
 
-def save_photo(frame) -> str:
+def save_thumbnail(frame, photo_path: str) -> None:
     """
-    Save a photo frame to disk with a timestamped filename.
+    Save a small thumbnail next to the full-size photo so the web gallery
+    can ship a fraction of the bytes per image.
+
+    Args:
+        frame: The full-size image/frame.
+        photo_path: Path where the full-size photo was saved.
+    """
+    try:
+        thumb = cv2.resize(frame, THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+        cv2.imwrite(thumbnail_path(photo_path), thumb,
+                    [cv2.IMWRITE_JPEG_QUALITY, THUMBNAIL_JPEG_QUALITY])
+    except Exception as e:
+        logging.error(f"[ERROR] Could not save thumbnail for {photo_path}: {e}", exc_info=True)
+
+# Background photo writer: the JPEG is encoded in memory up front, then
+# written on a single worker thread so the capture path never blocks on
+# SD-card latency. Flushing is left to the OS page cache.
+_photo_writer = ThreadPoolExecutor(max_workers=1)
+_last_photo_write = None
+
+def _write_photo(path: str, data: bytes) -> None:
+    """
+    Write encoded JPEG bytes to disk with a single open/write/close.
+
+    Args:
+        path: Destination file path.
+        data: Encoded JPEG bytes.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write fewer bytes than asked (e.g. as the SD card
+        # fills up); loop so the JPEG is either complete or an error raises.
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _log_write_failure(future) -> None:
+    """
+    Surface background photo-write failures in the log; without this a
+    failed write would be discarded silently with the future.
+    """
+    e = future.exception()
+    if e is not None:
+        logging.error(f"[ERROR] Could not write photo to disk: {e}", exc_info=e)
+
+def wait_for_photo_write() -> None:
+    """
+    Block until the most recent background photo write has finished.
+    """
+    future = _last_photo_write
+    if future is not None:
+        future.result()
+
+def save_photo(frame) -> tuple:
+    """
+    Save a photo frame to disk with a timestamped filename,
+    along with a thumbnail for the web gallery. The JPEG is encoded
+    synchronously but written in the background; the encoded bytes are
+    returned so callers can reuse them without re-reading the file.
 
     Args:
         frame: The image/frame to save.
     Returns:
-        The filename where the photo is saved.
+        Tuple of (filename, encoded JPEG bytes).
     """
+    global _last_photo_write
     ensure_directory(PHOTOS_DIR)
     filename = os.path.join(PHOTOS_DIR, timestamped_filename("photo", "jpg"))
-    cv2.imwrite(filename, frame)
+
+    ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, PHOTO_JPEG_QUALITY])
+    if not ok:
+        raise RuntimeError(f"JPEG encoding failed for {filename}")
+
+    data = buf.tobytes()
+    _last_photo_write = _photo_writer.submit(_write_photo, filename, data)
+    _last_photo_write.add_done_callback(_log_write_failure)
+    _photo_writer.submit(save_thumbnail, frame, filename)
     logging.info(f"Photo saved: {filename}")
     log_photo_path(filename)
-    return filename
+    return filename, data
+
+# Buffered photo-log writes: batching appends cuts the open/write/close
+# syscall round trip per photo, which is expensive on SD-card storage.
+LOG_FLUSH_MAX_ENTRIES = 8
+LOG_FLUSH_INTERVAL_SECONDS = 2.0
+_log_buffer: list = []
+_log_lock = threading.Lock()
+_log_last_flush = time.monotonic()
+
+def flush_photo_log() -> None:
+    """
+    Write any buffered photo-log entries to the log file in a single append.
+    Safe to call at any time; does nothing if the buffer is empty.
+    """
+    global _log_last_flush
+    with _log_lock:
+        if not _log_buffer:
+            return
+        entries = _log_buffer[:]
+        _log_buffer.clear()
+        _log_last_flush = time.monotonic()
+
+    try:
+        ensure_directory(LOGS_DIR)
+        with open(LOG_FILE, "a") as f:
+            f.write("\n".join(entries) + "\n")
+    except Exception as e:
+        logging.error(f"[ERROR] Could not flush photo log: {e}", exc_info=True)
 
 def log_photo_path(photo_path: str) -> None:
     """
-    Append the saved photo path to a log file inside LOGS_DIR.
-    Creates the log file if it does not exist.
+    Buffer the saved photo path for the log file inside LOGS_DIR.
+    Entries are flushed in batches of LOG_FLUSH_MAX_ENTRIES or after
+    LOG_FLUSH_INTERVAL_SECONDS, and on program exit.
 
     Args:
         photo_path: Path to the photo file.
     """
-    ensure_directory(LOGS_DIR)
     filename_only = os.path.basename(photo_path)
 
-    try:
-        with open(LOG_FILE, "a") as f:
-            f.write(filename_only + "\n")
-        logging.info(f"[LOG] Photo path logged: {filename_only}")
-    except Exception as e:
-        logging.error(f"[ERROR] Could not log photo path: {e}", exc_info=True)
+    with _log_lock:
+        _log_buffer.append(filename_only)
+        flush_due = (
+            len(_log_buffer) >= LOG_FLUSH_MAX_ENTRIES
+            or time.monotonic() - _log_last_flush >= LOG_FLUSH_INTERVAL_SECONDS
+        )
+
+    logging.info(f"[LOG] Photo path logged: {filename_only}")
+    if flush_due:
+        flush_photo_log()
 
 # ------------------ Motion LED Handlers ------------------ #
 def start_red():
@@ -192,6 +323,7 @@ def motion_led_on():
     global motion_start_time
     start_red()
     motion_start_time = time.time()
+    motion_event.set()
     if not cooldown_active:
         start_yellow_blink()
 
@@ -204,20 +336,24 @@ def motion_led_off():
     stop_red()
     stop_yellow_blink()
     motion_start_time = None
+    motion_event.clear()
 
-def start_yellow_blink() -> None:
+# LED patterns run on long-lived worker threads armed/disarmed via Events,
+# so motion events no longer pay thread-creation cost or race on booleans.
+_yellow_blink_arm = threading.Event()
+_yellow_flash_arm = threading.Event()
+_green_flash_requests = threading.Semaphore(0)  # One release per requested flash burst
+
+def _yellow_blink_worker() -> None:
     """
-    Begin blinking the YELLOW LED every second while motion is detected.
-    Runs in a daemon thread.
+    Persistent worker: blink the YELLOW LED every second while armed.
     """
-    global yellow_blinking
-    yellow_blinking = True
-
-    def _blink_yellow() -> None:
+    while True:
+        _yellow_blink_arm.wait()
         seconds = 0
         half_cycles = 0
         logging.info(f"[COUNTER] YELLOW elapsed {seconds} second")
-        while yellow_blinking:
+        while _yellow_blink_arm.is_set():
             leds["yellow"].toggle()
             half_cycles += 1
             if half_cycles % 2 == 0:
@@ -225,96 +361,149 @@ def start_yellow_blink() -> None:
                 logging.info(f"[COUNTER] YELLOW elapsed {seconds} seconds")
             time.sleep(0.5)
         leds["yellow"].off()  # Ensure LED is off when blinking stops
-        return None
+    return None
 
-    threading.Thread(target=_blink_yellow, daemon=True).start()
+def _yellow_flash_worker() -> None:
+    """
+    Persistent worker: flash the YELLOW LED rapidly while armed.
+    """
+    while True:
+        _yellow_flash_arm.wait()
+        while _yellow_flash_arm.is_set():
+            leds["yellow"].on()
+            time.sleep(YELLOW_FLASH_INTERVAL_SECONDS)
+            leds["yellow"].off()
+            time.sleep(YELLOW_FLASH_INTERVAL_SECONDS)
+    return None
+
+def _green_flash_worker() -> None:
+    """
+    Persistent worker: flash the GREEN LED a burst of GREEN_FLASH_COUNT
+    blinks for each request on the semaphore.
+    """
+    while True:
+        _green_flash_requests.acquire()
+        for _ in range(GREEN_FLASH_COUNT):
+            leds["green"].on()
+            time.sleep(GREEN_FLASH_INTERVAL_SECONDS)
+            leds["green"].off()
+            time.sleep(GREEN_FLASH_INTERVAL_SECONDS)
+        logging.info(f"[NOTIFICATION] GREEN LED Flashed")
+    return None
+
+def start_led_workers() -> None:
+    """
+    Launch the persistent LED worker threads. Call once at startup.
+    """
+    for worker in (_yellow_blink_worker, _yellow_flash_worker, _green_flash_worker):
+        threading.Thread(target=worker, daemon=True).start()
+    return None
+
+def start_yellow_blink() -> None:
+    """
+    Begin blinking the YELLOW LED every second while motion is detected.
+    """
+    _yellow_blink_arm.set()
     return None
 
 def stop_yellow_blink() -> None:
     """
     Stop blinking the YELLOW LED.
     """
-    global yellow_blinking
-    yellow_blinking = False
+    _yellow_blink_arm.clear()
     logging.info(f"[COUNTER] YELLOW Stopped")
     return None
 
-def start_flash_yellow(interval: float = YELLOW_FLASH_INTERVAL_SECONDS) -> None:
+def start_flash_yellow() -> None:
     """
-    Blink the YELLOW LED at a specified interval in a daemon thread.
-
-    Args:
-        interval: Time in seconds between ON and OFF states.
+    Begin flashing the YELLOW LED rapidly to signal capture in progress.
     """
-    global yellow_flash
-    yellow_flash = True
+    _yellow_flash_arm.set()
     logging.info(f"[NOTIFICATION] Flashing YELLOW LED")
-
-    def _flash_yellow() -> None:
-        while yellow_flash:
-            leds["yellow"].on()
-            time.sleep(interval)
-            leds["yellow"].off()
-            time.sleep(interval)
-        return None
-
-    threading.Thread(target=_flash_yellow, daemon=True).start()
     return None
 
 def stop_flash_yellow() -> None:
     """
     Stop flashing the YELLOW LED.
     """
-    global yellow_flash
-    yellow_flash = False
+    _yellow_flash_arm.clear()
     leds["yellow"].off()
     logging.info(f"[NOTIFICATION] Stopped flashing YELLOW LED")
     return None
 
-
-def flash_green(times: int = GREEN_FLASH_COUNT, interval: float = GREEN_FLASH_INTERVAL_SECONDS) -> None:
+def flash_green() -> None:
     """
-    Blink the GREEN LED a specified number of times quickly in a daemon thread.
-
-    Args:
-        times: Number of blinks.
-        interval: Time in seconds between ON and OFF states.
+    Request a burst of GREEN LED blinks to indicate a successful email.
     """
-    def _flash_green() -> None:
-        for _ in range(times):
-            leds["green"].on()
-            time.sleep(interval)
-            leds["green"].off()
-            time.sleep(interval)
-        logging.info(f"[NOTIFICATION] GREEN LED Flashed")
-        return None
-
-    threading.Thread(target=_flash_green, daemon=True).start()
+    _green_flash_requests.release()
     return None
 
 # ------------------ Camera Functions ------------------ #
+# Single-slot frame handoff between the capture and display threads.
+# The capture thread always overwrites the slot with the newest frame, so
+# a stalled display (e.g. X11 lag) never backs up the camera, and
+# take_photo can reuse the latest frame without a second capture.
+_latest_frame: list = [None]
+_frame_available = threading.Condition()
+_swap_channels = False  # True when the camera delivers RGB and we reverse to BGR
+
 def start_preview() -> None:
     """
-    Initialize the camera and start the preview window in a separate thread.
-    Allows live preview without blocking main program.
+    Initialize the camera and start the preview in two separate threads:
+    one capturing frames, one displaying them. A slow display only drops
+    preview frames; it never stalls capture.
     """
-    global picam2
+    global picam2, _swap_channels
     picam2 = Picamera2()
 
-    # Adjusting RGB
-    config = picam2.create_still_configuration(main={"size": FRAME_SIZE})
+    # BGR output straight from the camera: OpenCV expects BGR, so this
+    # removes a full color-convert pass over every preview frame. Note that
+    # Picamera2/libcamera format names are little-endian: requesting
+    # "RGB888" yields B,G,R-ordered arrays in memory, which is what OpenCV
+    # wants. ("BGR888", the default, yields R,G,B — that ordering is why
+    # the old code needed cvtColor.)
+    config = picam2.create_still_configuration(main={"size": FRAME_SIZE, "format": "RGB888"})
     picam2.configure(config)
+
+    # configure() may substitute another format if the stack can't deliver
+    # RGB888; check what we actually got and, if needed, reverse the channel
+    # order with a NumPy slice view instead of a full cv2.cvtColor pass.
+    configured_format = picam2.camera_configuration()["main"]["format"]
+    if configured_format != "RGB888":
+        logging.warning(
+            f"Camera delivered {configured_format} instead of RGB888; swapping channels in software"
+        )
+        _swap_channels = True
     picam2.set_controls({"AwbEnable": True})
 
     picam2.start()
 
-    def _preview_loop() -> None:
+    def _capture_loop() -> None:
         try:
-            cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_AUTOSIZE)
             while not preview_stop_event.is_set():
                 frame = picam2.capture_array()
-                frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-                cv2.imshow(WINDOW_NAME, frame_bgr)
+                if _swap_channels:
+                    frame = frame[:, :, ::-1]  # Reverse to BGR; cheaper than a cvtColor pass
+                with _frame_available:
+                    _latest_frame[0] = frame
+                    _frame_available.notify_all()
+        except Exception as e:
+            logging.error(f"Capture error: {e}", exc_info=True)
+        finally:
+            picam2.stop()
+            logging.info("[CAMERA] Capture thread stopped cleanly.")
+        return None
+
+    def _display_loop() -> None:
+        try:
+            cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_AUTOSIZE)
+            while not preview_stop_event.is_set():
+                with _frame_available:
+                    _frame_available.wait(timeout=1)
+                    frame = _latest_frame[0]
+                if frame is None:
+                    continue
+                cv2.imshow(WINDOW_NAME, frame)
                 if cv2.waitKey(1) & 0xFF == ord("q"):
                     preview_stop_event.set()
             cv2.waitKey(1)  # Process any remaining frames
@@ -323,57 +512,144 @@ def start_preview() -> None:
         finally:
             if cv2.getWindowProperty(WINDOW_NAME, cv2.WND_PROP_VISIBLE) >= 1:
                 cv2.destroyWindow(WINDOW_NAME)
-            picam2.stop()
             logging.info("[CAMERA] Preview thread stopped cleanly.")
         return None
 
-    threading.Thread(target=_preview_loop, daemon=True).start()
+    threading.Thread(target=_capture_loop, daemon=True).start()
+    threading.Thread(target=_display_loop, daemon=True).start()
     return None
 
-def take_photo() -> str:
+def take_photo() -> tuple:
     """
-    Capture a single photo frame from the camera and save it.
+    Save the most recent camera frame as a photo, falling back to a
+    direct capture if no preview frame is available yet.
 
     Returns:
-        Filename of the saved photo.
+        Tuple of (filename, encoded JPEG bytes) for the saved photo.
     Raises:
         RuntimeError: If camera is not initialized.
     """
     if picam2 is None:
         raise RuntimeError("Camera not initialized. Call start_preview() first.")
 
-    frame = picam2.capture_array()
-    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-    filename = save_photo(frame_bgr)
-    return filename
+    with _frame_available:
+        frame = _latest_frame[0]
+    if frame is None:
+        frame = picam2.capture_array()
+        if _swap_channels:
+            frame = frame[:, :, ::-1]  # Reverse to BGR; cheaper than a cvtColor pass
+    return save_photo(frame)
 
 # ------------------ Email Functions ------------------ #
-def send_email(photo_filename: str):
+# Persistent SMTP connection: reconnecting per email pays DNS + TCP + TLS
+# + AUTH round trips on every send, easily seconds on Pi WiFi.
+_smtp_client = None
+_smtp_lock = threading.Lock()
+
+def _get_smtp():
     """
-    Send an email with the captured photo attached.
+    Return a yagmail.SMTP client with a live connection, logging in only
+    when there is no open connection to reuse.
+
+    Returns:
+        A logged-in yagmail.SMTP instance.
+    """
+    global _smtp_client
+    with _smtp_lock:
+        if _smtp_client is None:
+            _smtp_client = yagmail.SMTP(SENDER_EMAIL, PASSWORD)
+
+        if _smtp_client.is_closed is False:
+            # Cheap liveness probe: the server drops idle connections after
+            # a few minutes, and motion events can be hours apart. Detect a
+            # dead socket now instead of failing mid-send.
+            try:
+                if _smtp_client.smtp.noop()[0] == 250:
+                    return _smtp_client
+                logging.warning("SMTP NOOP rejected, reconnecting")
+            except Exception as e:
+                logging.warning(f"SMTP connection stale, reconnecting: {e}")
+            _smtp_client.close()
+
+        # is_closed is None before the first login and True after close();
+        # login() builds a new connection.
+        _smtp_client.login()
+        logging.info("[EMAIL] SMTP connection established")
+        return _smtp_client
+
+def close_smtp() -> None:
+    """
+    Close the cached SMTP connection, if any.
+    """
+    global _smtp_client
+    with _smtp_lock:
+        if _smtp_client is not None:
+            try:
+                _smtp_client.close()
+            except Exception as e:
+                logging.warning(f"SMTP close error: {e}")
+            _smtp_client = None
+
+def send_email(photo_filename: str, jpeg_bytes: bytes = None):
+    """
+    Send an email with the captured photo attached, reusing the cached
+    SMTP connection across sends. When the encoded JPEG bytes are
+    provided, they are attached directly from memory so the photo is
+    never re-read from disk.
 
     Args:
         photo_filename: Path to the photo file to attach.
+        jpeg_bytes: Optional encoded JPEG bytes of the same photo.
     Raises:
-        ValueError: If email password is not set in environment variables.
-        FileNotFoundError: If the photo file does not exist.
-    """
-    if not PASSWORD:
-        raise ValueError("Email password not set in environment variables.")
-
-    yag = yagmail.SMTP(SENDER_EMAIL, PASSWORD)
-
-    attachment_path = Path(photo_filename)
-    if not attachment_path.exists():
-        raise FileNotFoundError(f"Attachment not found: {attachment_path}")
-
-    yag.send(
-        to=RECEIVER_EMAIL,
-        subject=SUBJECT,
-        contents=BODY,
-        attachments=str(attachment_path),
-    )
-    logging.info(f"Email sent successfully with attachment: {attachment_path}")
+        ValueError: If email credentials are not set in environment variables.
+        FileNotFoundError: If the photo file does not exist and no bytes
+            were provided.
+    """
+    require_email_credentials()
+
+    if jpeg_bytes is not None:
+        attachment = io.BytesIO(jpeg_bytes)
+        attachment.name = os.path.basename(photo_filename)
+    else:
+        wait_for_photo_write()  # The attachment may still be writing in the background
+        attachment_path = Path(photo_filename)
+        if not attachment_path.exists():
+            raise FileNotFoundError(f"Attachment not found: {attachment_path}")
+        attachment = str(attachment_path)
+
+    yag = _get_smtp()
+    try:
+        # yagmail's send() reconnects and re-authenticates unconditionally;
+        # prepare the message and send it on the already-open connection.
+        recipients, msg_strings = yag.prepare_send(
+            to=RECEIVER_EMAIL,
+            subject=SUBJECT,
+            contents=BODY,
+            attachments=attachment,
+        )
+    except Exception:
+        close_smtp()  # Force a fresh connection on the next send
+        raise
+
+    # The connection can still die between the liveness probe and the send;
+    # retry once on a fresh connection before giving up so a single dropped
+    # socket never costs an alert email.
+    for attempt in range(2):
+        try:
+            result = yag._attempt_send(recipients, msg_strings)
+        except Exception:
+            close_smtp()  # Force a fresh connection on the next send
+            raise
+        if result is not False:
+            break
+        close_smtp()
+        if attempt == 0:
+            logging.warning("[EMAIL] SMTP connection dropped mid-send; retrying on a fresh connection")
+            yag = _get_smtp()
+        else:
+            raise RuntimeError("SMTP send failed: server disconnected")
+
+    logging.info(f"Email sent successfully with attachment: {photo_filename}")
 
 # ------------------ Cleanup Functions ------------------ #
 def cleanup():
@@ -384,6 +660,9 @@ def cleanup():
     global picam2
     logging.info("[CLEANUP] Stopping threads and releasing resources...")
 
+    flush_photo_log()  # Persist any buffered log entries before exiting
+    _photo_writer.shutdown(wait=True)  # Finish any in-flight photo writes
+    close_smtp()
     preview_stop_event.set()
     time.sleep(0.2)  # Allow preview thread to stop
 
@@ -425,47 +704,71 @@ def reset_motion_timer():
     motion_start_time = None
     return None
 
-def cooldown_timer():
+def start_cooldown():
     """
-    Set cooldown flag for COOLDOWN_DURATION_SECONDS to prevent
-    repeated photo capture and email sending.
+    Begin the cooldown window using a Timer instead of a sleeping thread,
+    preventing repeated photo capture and email sending.
     """
     global cooldown_active
+    cooldown_active = True
+    cooldown_done_event.clear()
     logging.info(f"[COOLDOWN] Started ({COOLDOWN_DURATION_SECONDS}s)")
-    time.sleep(COOLDOWN_DURATION_SECONDS)
+    timer = threading.Timer(COOLDOWN_DURATION_SECONDS, end_cooldown)
+    timer.daemon = True
+    timer.start()
+    return None
+
+def end_cooldown():
+    """
+    Clear the cooldown flag and wake any waiter.
+    """
+    global cooldown_active
     cooldown_active = False
+    cooldown_done_event.set()
     logging.info(f"[COOLDOWN] Ended")
     return None
 
 def handle_motion():
     """
-    Continuously monitor motion duration. If motion lasts longer than
-    MOTION_THRESHOLD_SECONDS and not in cooldown, capture photo and send email.
-    Runs in a daemon thread.
+    Wait for motion events and trigger photo capture plus email once motion
+    has lasted MOTION_THRESHOLD_SECONDS outside of cooldown. Blocks on
+    events instead of polling, so the thread sleeps whenever nothing is
+    happening. Runs in a daemon thread.
     """
-    global cooldown_active
     while True:
-        if motion_start_time and not cooldown_active:
-            duration = time.time() - motion_start_time
-            if duration >= MOTION_THRESHOLD_SECONDS:
-                stop_yellow_blink()
-                logging.info("[MOTION] Motion threshold reached. Taking photo and sending email...")
-                start_flash_yellow()
-                email_sent = False
-                try:
-                    photo_file = take_photo()
-                    send_email(photo_file)
-                    email_sent = True
-                except Exception as e:
-                    logging.error(f"[ERROR] Failed to capture photo or send email: {e}", exc_info=True)
-                finally:
-                    if email_sent:
-                        flash_green()
-                    stop_flash_yellow()
-                    cooldown_active = True
-                    threading.Thread(target=cooldown_timer, daemon=True).start()
-                    reset_motion_timer()
-        time.sleep(0.2)
+        motion_event.wait()  # Block until the PIR sensor reports motion
+        cooldown_done_event.wait()  # Block out the cooldown window
+
+        start = motion_start_time
+        if start is None or not motion_event.is_set():
+            # Motion already handled or just ended; wait for a fresh edge
+            motion_event.clear()
+            continue
+
+        remaining = MOTION_THRESHOLD_SECONDS - (time.time() - start)
+        if remaining > 0:
+            # Sleep out the threshold, then loop to re-check that motion
+            # is still active and started at the same time.
+            time.sleep(remaining)
+            continue
+
+        stop_yellow_blink()
+        logging.info("[MOTION] Motion threshold reached. Taking photo and sending email...")
+        start_flash_yellow()
+        email_sent = False
+        try:
+            photo_file, jpeg_bytes = take_photo()
+            send_email(photo_file, jpeg_bytes)
+            email_sent = True
+        except Exception as e:
+            logging.error(f"[ERROR] Failed to capture photo or send email: {e}", exc_info=True)
+        finally:
+            if email_sent:
+                flash_green()
+            stop_flash_yellow()
+            start_cooldown()
+            reset_motion_timer()
+            motion_event.clear()  # Require a new motion edge before re-triggering
     return None
 
 # ------------------ Main Program ------------------ #
@@ -483,9 +786,14 @@ def main():
         time.sleep(0.5)  # short delay to simulate progress
 
     # --- Cleanup Handlers ---
+    atexit.register(flush_photo_log)
     atexit.register(cleanup)
     signal.signal(signal.SIGINT, lambda sig, frame: cleanup())
 
+    # --- LED Workers ---
+    start_led_workers()
+    logging.info("[LED] Worker threads started")
+
     # --- Camera Preview ---
     start_preview()
     logging.info("[CAMERA] Preview started")